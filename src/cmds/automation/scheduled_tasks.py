@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from discord.ext import commands, tasks
 from sqlalchemy import select
@@ -34,7 +34,7 @@ class ScheduledTasks(commands.Cog):
     async def auto_unban(self) -> None:
         """Task to automatically unban members."""
         unban_tasks = []
-        unban_time = datetime.timestamp(datetime.now() + timedelta(minutes=1)) * 1000
+        unban_time = (datetime.now(tz=timezone.utc) + timedelta(minutes=1)).timestamp() * 1000
         logger.debug(f"Checking for bans to remove until {unban_time}.")
         async with AsyncSessionLocal() as session:
             result = await session.scalars(
@@ -68,7 +68,7 @@ class ScheduledTasks(commands.Cog):
     async def auto_unmute(self) -> None:
         """Task to automatically unmute members."""
         unmute_tasks = []
-        unmute_time = datetime.timestamp(datetime.now() + timedelta(minutes=1)) * 1000
+        unmute_time = (datetime.now(tz=timezone.utc) + timedelta(minutes=1)).timestamp() * 1000
         logger.debug(f"Checking for mutes to remove until {unmute_time}.")
         async with AsyncSessionLocal() as session:
             result = await session.scalars(select(Mute).filter(Mute.unmute_time <= unmute_time))
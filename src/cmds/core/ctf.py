@@ -142,10 +142,14 @@ class CtfCog(commands.Cog):
         try:
             logger.debug(f'Deleting channels and roles for "{ctf_name}"')
             ctf_name = ctf_name.lower()
-            channel_rules = discord.utils.get(ctx.guild.channels, name=f"{ctf_name}-rules")
-            channel_announcements = discord.utils.get(ctx.guild.channels, name=f"{ctf_name}-announcements")
-            channel_support = discord.utils.get(ctx.guild.channels, name=f"{ctf_name}-support")
-            channel_general = discord.utils.get(ctx.guild.channels, name=f"{ctf_name}-general")
+            # Index the guild channels once instead of scanning the full list for every lookup.
+            channels = {}
+            for channel in ctx.guild.channels:
+                channels.setdefault(channel.name, channel)
+            channel_rules = channels.get(f"{ctf_name}-rules")
+            channel_announcements = channels.get(f"{ctf_name}-announcements")
+            channel_support = channels.get(f"{ctf_name}-support")
+            channel_general = channels.get(f"{ctf_name}-general")
             channel_cat = discord.utils.get(ctx.guild.categories, name=f"{ctf_name}")
             admin_role = discord.utils.get(ctx.guild.roles, name=f"{ctf_name}-Admin")
             par_role = discord.utils.get(ctx.guild.roles, name=f"{ctf_name}-Participant")
@@ -119,20 +119,26 @@ class HistoryCog(commands.Cog):
         entry_records: List[List[str]] = [[]]
         if history_entries is not None:
             current_row = 0
+            current_row_len = 0
             for entry in history_entries:
                 entry_text = entry_handler(entry, today_date=today_date)
+                entry_len = len(entry_text)
 
-                if sum(len(r) for r in entry_records[current_row]) + len(entry_text) > 1000:
+                if current_row_len + entry_len > 1000:
                     entry_records.append(list())
                     current_row += 1
+                    current_row_len = 0
                 entry_records[current_row].append(entry_text)
+                current_row_len += entry_len
 
         if len(entry_records[0]) == 0:
             embed.add_field(name=f"{entry_type.capitalize()}:", value=f"No {entry_type.lower()}.", inline=False)
         else:
-            for i in range(0, len(entry_records)):
+            title = entry_type.capitalize()
+            total_rows = len(entry_records)
+            for i in range(0, total_rows):
                 embed.add_field(
-                    name=f"{entry_type.capitalize()} ({i + 1}/{len(entry_records)}):",
+                    name=f"{title} ({i + 1}/{total_rows}):",
                     value="\n\n".join(entry_records[i]),
                     inline=False,
                 )
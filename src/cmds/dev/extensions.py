@@ -43,13 +43,15 @@ class Extensions(commands.Cog):
             "reload": EXTENSIONS
         }
 
+        prefix = f"{cmds.__name__}."
+        typed = ctx.value.lower()
         results = []
         for extension in extensions[verb]:
             # Format an extension into a human-readable format.
-            formatted_extension = extension.removeprefix(f"{cmds.__name__}.")
+            formatted_extension = extension.removeprefix(prefix)
 
             # Select the extensions that begin with the characters entered so far.
-            if formatted_extension.startswith(ctx.value.lower()):
+            if formatted_extension.startswith(typed):
                 results.append(OptionChoice(formatted_extension, extension))
 
         return results
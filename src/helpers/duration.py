@@ -5,6 +5,16 @@ import time
 
 logger = logging.getLogger(__name__)
 
+_DURATION_RE = re.compile(r"(-?(?:\d+\.?\d*|\d*\.?\d+)(?:e[-+]?\d+)?)\s*([a-z]*)", re.IGNORECASE)
+
+_UNITS = {"s": 1}
+_UNITS["m"] = _UNITS["min"] = _UNITS["mins"] = _UNITS["s"] * 60
+_UNITS["h"] = _UNITS["hr"] = _UNITS["hour"] = _UNITS["hours"] = _UNITS["m"] * 60
+_UNITS["d"] = _UNITS["day"] = _UNITS["days"] = _UNITS["h"] * 24
+_UNITS["wk"] = _UNITS["w"] = _UNITS["week"] = _UNITS["weeks"] = _UNITS["d"] * 7
+_UNITS["month"] = _UNITS["months"] = _UNITS["mo"] = _UNITS["d"] * 30
+_UNITS["y"] = _UNITS["yr"] = _UNITS["year"] = _UNITS["years"] = _UNITS["d"] * 365
+
 
 def validate_duration(duration: str, baseline_ts: int = None) -> (int, str):
     """Validate duration string and convert to seconds."""
@@ -26,23 +36,15 @@ def parse_duration_str(duration: str, baseline_ts: int = None) -> int | None:
 
     Example: "3w" to a timestamp in seconds since 1970/01/01 (UNIX epoch time).
     """
-    dur = re.compile(r"(-?(?:\d+\.?\d*|\d*\.?\d+)(?:e[-+]?\d+)?)\s*([a-z]*)", re.IGNORECASE)
-    units = {"s": 1}
-    units["m"] = units["min"] = units["mins"] = units["s"] * 60
-    units["h"] = units["hr"] = units["hour"] = units["hours"] = units["m"] * 60
-    units["d"] = units["day"] = units["days"] = units["h"] * 24
-    units["wk"] = units["w"] = units["week"] = units["weeks"] = units["d"] * 7
-    units["month"] = units["months"] = units["mo"] = units["d"] * 30
-    units["y"] = units["yr"] = units["year"] = units["years"] = units["d"] * 365
     sum_seconds = 0
 
     while duration:
-        m = dur.match(duration)
+        m = _DURATION_RE.match(duration)
         if not m:
             return None
         duration = duration[m.end():]
         try:
-            sum_seconds += int(m.groups()[0]) * units.get(m.groups()[1], 1)
+            sum_seconds += int(m.groups()[0]) * _UNITS.get(m.groups()[1], 1)
         except ValueError:
             return None
 
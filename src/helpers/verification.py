@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import traceback
 from typing import Dict, List, Optional, Any, TypeVar
@@ -73,9 +74,7 @@ async def send_verification_instructions(
     )
 
     try:
-        await member.send(embed=embed_step1)
-        await member.send(embed=embed_step2)
-        await member.send(embed=embed_step3)
+        await member.send(embeds=[embed_step1, embed_step2, embed_step3])
     except Forbidden as ex:
         logger.error("Exception during verify call", exc_info=ex)
         return await ctx.respond(
@@ -97,6 +96,15 @@ def get_labs_session() -> aiohttp.ClientSession:
     return aiohttp.ClientSession(headers={"Authorization": f"Bearer {settings.HTB_API_KEY}"})
 
 
+async def _get_labs_json(session: aiohttp.ClientSession, url: str, lookup: str) -> dict:
+    """GET a JSON document from the HTB Labs API, returning an empty dict on a non-OK status."""
+    async with session.get(url) as r:
+        if r.status == 200:
+            return await r.json()
+        logger.error("Non-OK HTTP status code returned from %s lookup: %s.", lookup, r.status)
+        return {}
+
+
 async def get_user_details(labs_id: int | str) -> dict:
     """Get user details from HTB."""
 
@@ -107,26 +115,17 @@ async def get_user_details(labs_id: int | str) -> dict:
     user_content_api_url = f"{settings.API_V4_URL}/user/profile/content/{labs_id}"
 
     async with get_labs_session() as session:
-        async with session.get(user_profile_api_url) as r:
-            if r.status == 200:
-                profile_response = await r.json()
-            else:
-                logger.error(
-                    f"Non-OK HTTP status code returned from user details lookup: {r.status}."
-                )
-                profile_response = {}
-
-        async with session.get(user_content_api_url) as r:
-            if r.status == 200:
-                content_response = await r.json()
-            else:
-                logger.error(
-                    f"Non-OK HTTP status code returned from user content lookup: {r.status}."
-                )
-                content_response = {}
-
-    profile = profile_response.get("profile", {})
-    profile["content"] = content_response.get("profile", {}).get("content", {})
+        # The task group cancels the sibling lookup if one fails, so nothing outlives the session.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                profile_task = tg.create_task(_get_labs_json(session, user_profile_api_url, "user details"))
+                content_task = tg.create_task(_get_labs_json(session, user_content_api_url, "user content"))
+        except ExceptionGroup as eg:
+            # Surface the client error itself, as the sequential lookups did.
+            raise eg.exceptions[0] from eg
+
+    profile = profile_task.result().get("profile", {})
+    profile["content"] = content_task.result().get("profile", {}).get("content", {})
     return profile
 
 
@@ -143,7 +142,7 @@ async def get_season_rank(htb_uid: int) -> str | None:
                 response = {}
             else:
                 logger.error(
-                    f"Non-OK HTTP status code returned from identifier lookup: {r.status}."
+                    "Non-OK HTTP status code returned from identifier lookup: %s.", r.status
                 )
                 response = {}
 
@@ -170,7 +169,7 @@ async def process_certification(certid: str, name: str):
                 return False
             else:
                 logger.error(
-                    f"Non-OK HTTP status code returned from identifier lookup: {r.status}."
+                    "Non-OK HTTP status code returned from identifier lookup: %s.", r.status
                 )
                 response = {}
     try:
@@ -241,7 +240,7 @@ async def _set_nickname(member: Member, nickname: str) -> bool:
         await member.edit(nick=nickname)
         return True
     except Forbidden as e:
-        logger.error(f"Exception whe trying to edit the nick-name of the user: {e}")
+        logger.error("Exception whe trying to edit the nick-name of the user: %s", e)
         return False
 
 
@@ -258,7 +257,7 @@ async def process_account_identification(
     try:
         await member.add_roles(member.guild.get_role(settings.roles.VERIFIED), atomic=True)  # type: ignore
     except Exception as e:
-        logger.error(f"Failed to add VERIFIED role to user {member.id}: {e}")
+        logger.error("Failed to add VERIFIED role to user %s: %s", member.id, e)
         # Don't raise - continue with other operations
 
     nickname_changed = False
@@ -270,32 +269,32 @@ async def process_account_identification(
 
     if not nickname_changed:
         logger.warning(
-            f"No username provided for {member.name} with ID {member.id} during identification."
+            "No username provided for %s with ID %s during identification.", member.name, member.id
         )
 
     if traits.get("mp_user_id"):
         try:
-            logger.debug(f"MP user ID: {traits.get('mp_user_id', None)}")
+            logger.debug("MP user ID: %s", traits.get("mp_user_id", None))
             htb_user_details = await get_user_details(traits.get("mp_user_id", None))
             if htb_user_details:
                 await process_labs_identification(htb_user_details, member, bot)  # type: ignore
 
                 if not nickname_changed and htb_user_details.get("username"):
                     logger.debug(
-                        f"Falling back on HTB username to set nickname for {member.name} with ID {member.id}."
+                        "Falling back on HTB username to set nickname for %s with ID %s.", member.name, member.id
                     ) 
                     await _set_nickname(member, htb_user_details["username"])
         except Exception as e:
-            logger.error(f"Failed to process labs identification for user {member.id}: {e}")
+            logger.error("Failed to process labs identification for user %s: %s", member.id, e)
             # Don't raise - this is not critical
 
     if traits.get("banned", False) == True:  # noqa: E712 - explicit bool only, no truthiness
         try:
-            logger.debug(f"Handling banned user {member.id}")
+            logger.debug("Handling banned user %s", member.id)
             await _handle_banned_user(member, bot)
             return
         except Exception as e:
-            logger.error(f"Failed to handle banned user {member.id}: {e}")
+            logger.error("Failed to handle banned user %s: %s", member.id, e)
             logger.exception(traceback.format_exc())
             # Don't raise - continue processing
 
@@ -352,7 +351,7 @@ def _get_roles_to_remove(member: Member, guild: Guild) -> list[Role]:
                 if guild_role:
                     to_remove.append(guild_role)
     except Exception as e:
-        logger.error(f"Error processing existing roles for user {member.id}: {e}")
+        logger.error("Error processing existing roles for user %s: %s", member.id, e)
     return to_remove
 
 
@@ -406,7 +405,7 @@ async def _process_season_rank_roles(mp_user_id: int, guild: Guild) -> list[Role
                 if season_role:
                     roles.append(season_role)
     except Exception as e:
-        logger.error(f"Error getting season rank for user {mp_user_id}: {e}")
+        logger.error("Error getting season rank for user %s: %s", mp_user_id, e)
     return roles
 
 
@@ -424,7 +423,7 @@ def _process_vip_roles(htb_user_details: dict, guild: Guild) -> list[Role]:
             if vip_plus_role:
                 roles.append(vip_plus_role)
     except Exception as e:
-        logger.error(f"Error processing VIP roles: {e}")
+        logger.error("Error processing VIP roles: %s", e)
     return roles
 
 
@@ -433,7 +432,7 @@ def _process_hof_position_roles(htb_user_ranking: str | int, guild: Guild) -> li
     roles = []
     try:
         hof_position = htb_user_ranking or "unranked"
-        logger.debug(f"HTB user ranking: {hof_position}")
+        logger.debug("HTB user ranking: %s", hof_position)
         if hof_position != "unranked":
             position = int(hof_position)
             pos_top = _get_position_tier(position)
@@ -445,7 +444,7 @@ def _process_hof_position_roles(htb_user_ranking: str | int, guild: Guild) -> li
                     if pos_role:
                         roles.append(pos_role)
     except (ValueError, TypeError) as e:
-        logger.error(f"Error processing HOF position: {e}")
+        logger.error("Error processing HOF position: %s", e)
     return roles
 
 
@@ -480,7 +479,7 @@ def _process_creator_roles(htb_user_content: dict, guild: Guild) -> list[Role]:
                 logger.debug("Adding sherlock creator role to user.")
                 roles.append(sherlock_creator_role)
     except Exception as e:
-        logger.error(f"Error processing creator roles: {e}")
+        logger.error("Error processing creator roles: %s", e)
     return roles
 
 
@@ -492,10 +491,10 @@ async def _apply_role_changes(
         if to_remove:
             await member.remove_roles(*to_remove, atomic=True)
     except Exception as e:
-        logger.error(f"Error removing roles from user {member.id}: {e}")
+        logger.error("Error removing roles from user %s: %s", member.id, e)
     
     try:
         if to_assign:
             await member.add_roles(*to_assign, atomic=True)
     except Exception as e:
-        logger.error(f"Error adding roles to user {member.id}: {e}")
+        logger.error("Error adding roles to user %s: %s", member.id, e)
@@ -8,7 +8,7 @@ from src import cmds
 
 def unqualify(name: str) -> str:
     """Return an unqualified name given a qualified module/package `name`."""
-    return name.rsplit(".", maxsplit=1)[-1]
+    return name.rpartition(".")[2]
 
 
 def walk_extensions() -> Iterator[str]:
@@ -1,8 +1,8 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
-from discord import Embed, Member, Reaction
+from discord import Embed, Member, Message, Reaction
 from discord.abc import User
 from discord.commands import ApplicationContext
 from discord.ext.commands import Paginator
@@ -20,6 +20,27 @@ PAGINATION_EMOJIS = (FIRST_EMOJI, LEFT_EMOJI, RIGHT_EMOJI, LAST_EMOJI, LOCK_EMOJ
 log = logging.getLogger(__name__)
 
 
+def _make_event_check(
+    ctx: ApplicationContext, message: Message, restrict_to_user: Optional[User]
+) -> Callable[[Reaction, Member], bool]:
+    """Build a `reaction_add` check for a paginated message, binding the compared IDs once."""
+    message_id = message.id
+    bot_user_id = ctx.bot.user.id
+    restricted_id = restrict_to_user.id if restrict_to_user else None
+
+    def event_check(reaction_: Reaction, user_: Member) -> bool:
+        """Make sure that this reaction is what we want to operate on."""
+        # Conditions for a successful pagination:
+        return (
+            reaction_.message.id == message_id  # Reaction is on this message.
+            and reaction_.emoji in PAGINATION_EMOJIS  # Reaction is one of the pagination emotes.
+            and user_.id != bot_user_id  # Reaction was not made by the Bot.
+            and (restricted_id is None or user_.id == restricted_id)  # Unrestricted, or by a whitelisted user.
+        )
+
+    return event_check
+
+
 class EmptyPaginatorEmbedError(Exception):
     """Base Exception class for an empty paginator embed."""
 
@@ -103,23 +124,6 @@ class LinePaginator(Paginator):
         If `empty` is True, an empty line will be placed between each given line.
         """
 
-        def event_check(reaction_: Reaction, user_: Member) -> bool:
-            """Make sure that this reaction is what we want to operate on."""
-            no_restrictions = (
-                not restrict_to_user  # Pagination is not restricted.
-                or user_.id == restrict_to_user.id  # The reaction was by a whitelisted user.
-            )
-
-            # Conditions for a successful pagination:
-            return all(
-                (
-                    reaction_.message.id == message.id,  # Reaction is on this message.
-                    reaction_.emoji in PAGINATION_EMOJIS,  # Reaction is one of the pagination emotes.
-                    user_.id != ctx.bot.user.id,  # Reaction was not made by the Bot.
-                    no_restrictions  # There were no restrictions.
-                )
-            )
-
         paginator = cls(prefix=prefix, suffix=suffix, max_size=max_size, max_lines=max_lines)
         current_page = 0
 
@@ -161,6 +165,7 @@ class LinePaginator(Paginator):
 
         await ctx.respond(embed=embed)
         message = await ctx.interaction.original_message()
+        event_check = _make_event_check(ctx, message, restrict_to_user)
 
         log.debug(f"Paginator created with {len(paginator.pages)} pages (ID: {message.id})")
 
@@ -282,23 +287,6 @@ class ImagePaginator(Paginator):
               defaulting to five minutes (300 seconds).
         """
 
-        def event_check(reaction_: Reaction, user_: Member) -> bool:
-            """Make sure that this reaction is what we want to operate on."""
-            no_restrictions = (
-                not restrict_to_user  # Pagination is not restricted.
-                or user_.id == restrict_to_user.id  # The reaction was by a whitelisted user.
-            )
-
-            # Conditions for a successful pagination:
-            return all(
-                (
-                    reaction_.message.id == message.id,  # Reaction is on this message.
-                    reaction_.emoji in PAGINATION_EMOJIS,  # Reaction is one of the pagination emotes.
-                    user_.id != ctx.bot.user.id,  # Reaction was not made by the Bot.
-                    no_restrictions  # There were no restrictions.
-                )
-            )
-
         paginator = cls(prefix=prefix, suffix=suffix)
         current_page = 0
 
@@ -345,6 +333,7 @@ class ImagePaginator(Paginator):
 
         await ctx.respond(embed=embed)
         message = await ctx.interaction.original_message()
+        event_check = _make_event_check(ctx, message, restrict_to_user)
 
         log.debug(f"Paginator created with {len(paginator.pages)} pages (ID: {message.id})")
 
@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 
+import aiohttp
 import aioresponses
 import discord
 import pytest
@@ -42,7 +43,7 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
                 f"{settings.API_V4_URL}/user/profile/basic/{labs_id}",
                 status=404,
             )
-            # Mock the content API call - won't be reached due to 404 above
+            # Mock the content API call - fetched concurrently with the profile lookup
             m.get(
                 f"{settings.API_V4_URL}/user/profile/content/{labs_id}",
                 status=200,
@@ -63,7 +64,7 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
                 f"{settings.API_V4_URL}/user/profile/basic/{labs_id}",
                 status=500,
             )
-            # Mock the content API call - won't be reached due to 500 above
+            # Mock the content API call - fetched concurrently with the profile lookup
             m.get(
                 f"{settings.API_V4_URL}/user/profile/content/{labs_id}",
                 status=200,
@@ -74,6 +75,27 @@ class TestGetUserDetails(unittest.IsolatedAsyncioTestCase):
             # Function returns empty dict with content when basic profile fails
             self.assertEqual(result, {"content": {}})
 
+    @pytest.mark.asyncio
+    async def test_get_user_details_client_error(self):
+        labs_id = "12345"
+
+        with aioresponses.aioresponses() as m:
+            # Mock the profile API call raising a connection error
+            m.get(
+                f"{settings.API_V4_URL}/user/profile/basic/{labs_id}",
+                exception=aiohttp.ClientConnectionError("connection reset"),
+            )
+            # Mock the content API call - cancelled once the profile lookup fails
+            m.get(
+                f"{settings.API_V4_URL}/user/profile/content/{labs_id}",
+                status=200,
+                payload={"profile": {"content": {}}},
+            )
+
+            # The client error itself propagates, not an ExceptionGroup
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                await get_user_details(labs_id)
+
 
 class TestProcessLabsIdentification(unittest.IsolatedAsyncioTestCase):
     def setUp(self):